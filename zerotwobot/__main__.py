@@ -724,11 +724,12 @@ def main():
             key='bot.key', 
             cert='cert.pem', 
             webhook_url=URL,
-            drop_pending_updates=False
+            drop_pending_updates=False,
+            allowed_updates=Update.ALL_TYPES,
         )
     else:
         LOGGER.info("Using long polling.")
-        application.run_polling(timeout=15, drop_pending_updates=False)   
+        application.run_polling(timeout=15, drop_pending_updates=False, allowed_updates=Update.ALL_TYPES)   
 
     if len(argv) not in (1, 3, 4):
         telethn.disconnect()
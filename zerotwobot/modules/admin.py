@@ -12,6 +12,10 @@ from zerotwobot.modules.helper_funcs.chat_status import (
     check_admin,
     connection_status,
     ADMIN_CACHE,
+    BOT_MEMBER_CACHE,
+    CHAT_CACHE,
+    bot_has_permission,
+    NONADMIN_CACHE,
 )
 
 from zerotwobot.modules.helper_funcs.extraction import (
@@ -218,10 +222,10 @@ async def demote(update: Update, context: ContextTypes.DEFAULT_TYPE) -> str:
 
 @check_admin(is_user=True)
 async def refresh_admin(update, _):
-    try:
-        ADMIN_CACHE.pop(update.effective_chat.id)
-    except KeyError:
-        pass
+    ADMIN_CACHE.pop(update.effective_chat.id, None)
+    BOT_MEMBER_CACHE.pop(update.effective_chat.id, None)
+    CHAT_CACHE.pop(update.effective_chat.id, None)
+    NONADMIN_CACHE.pop(update.effective_chat.id, None)
 
     await update.effective_message.reply_text("Admins cache refreshed!")
 
@@ -480,8 +484,7 @@ async def invite(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if chat.username:
         await update.effective_message.reply_text(f"https://t.me/{chat.username}")
     elif chat.type in [ChatType.SUPERGROUP, ChatType.CHANNEL]:
-        bot_member = await chat.get_member(bot.id)
-        if (bot_member.can_invite_users if isinstance(bot_member, ChatMemberAdministrator) else None):
+        if await bot_has_permission(chat, "can_invite_users"):
             invitelink = await bot.exportChatInviteLink(chat.id)
             await update.effective_message.reply_text(invitelink)
         else:
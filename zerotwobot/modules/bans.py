@@ -304,7 +304,7 @@ async def kick(update: Update, context: ContextTypes.DEFAULT_TYPE) -> str:
         await message.reply_text("Yeahhh I'm not gonna do that.")
         return log_message
 
-    if await is_user_ban_protected(chat, user_id):
+    if await is_user_ban_protected(chat, user_id, member):
         await message.reply_text("I really wish I could kick this user....")
         return log_message
 
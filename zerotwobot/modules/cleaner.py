@@ -3,11 +3,12 @@ import html
 from zerotwobot import ALLOW_EXCL, CustomCommandHandler, application
 from zerotwobot.modules.disable import DisableAbleCommandHandler
 from zerotwobot.modules.helper_funcs.chat_status import (
+    bot_has_permission,
     connection_status,
     check_admin
 )
 from zerotwobot.modules.sql import cleaner_sql as sql
-from telegram import Update, ChatMemberAdministrator
+from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import (
     ContextTypes,
@@ -42,31 +43,25 @@ for handler_list in application.handlers:
 
 
 async def clean_blue_text_must_click(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    bot = context.bot
     chat = update.effective_chat
     message = update.effective_message
-    member = await chat.get_member(bot.id)
-    
-    if isinstance(member, ChatMemberAdministrator):
-        if (
-            (member.can_delete_messages if isinstance(member, ChatMemberAdministrator) else None)
-            and sql.is_enabled(chat.id)
-        ):
-            fst_word = message.text.strip().split(None, 1)[0]
 
-            if len(fst_word) > 1 and any(
-                fst_word.startswith(start) for start in CMD_STARTERS
-            ):
+    if await bot_has_permission(chat, "can_delete_messages") and sql.is_enabled(chat.id):
+        fst_word = message.text.strip().split(None, 1)[0]
+
+        if len(fst_word) > 1 and any(
+            fst_word.startswith(start) for start in CMD_STARTERS
+        ):
 
-                command = fst_word[1:].split("@")
-                chat = update.effective_chat
+            command = fst_word[1:].split("@")
+            chat = update.effective_chat
 
-                ignored = sql.is_command_ignored(chat.id, command[0])
-                if ignored:
-                    return
+            ignored = sql.is_command_ignored(chat.id, command[0])
+            if ignored:
+                return
 
-                if command[0] not in command_list:
-                    await message.delete()
+            if command[0] not in command_list:
+                await message.delete()
 
 
 
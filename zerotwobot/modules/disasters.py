@@ -12,7 +12,8 @@ from zerotwobot import (
 )
 from zerotwobot.modules.helper_funcs.chat_status import (
     whitelist_plus,
-    check_admin
+    check_admin,
+    refresh_sudo_ids,
 )
 from zerotwobot.modules.helper_funcs.extraction import extract_user
 from zerotwobot.modules.log_channel import gloggable
@@ -62,6 +63,7 @@ async def addsudo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> str:
 
     data["sudos"].append(user_id)
     DRAGONS.append(user_id)
+    refresh_sudo_ids()
 
     with open(ELEVATED_USERS_FILE, "w") as outfile:
         json.dump(data, outfile, indent=4)
@@ -105,6 +107,7 @@ async def removesudo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> str:
     if user_id in DRAGONS:
         await message.reply_text("Requested HA to demote this user to Civilian")
         DRAGONS.remove(user_id)
+        refresh_sudo_ids()
         data["sudos"].remove(user_id)
 
         with open(ELEVATED_USERS_FILE, "w") as outfile:
@@ -1,19 +1,212 @@
+import asyncio
+from dataclasses import dataclass
 from enum import Enum
 from functools import wraps
-from threading import RLock
+from operator import attrgetter
 from time import perf_counter
+from typing import Optional
+from weakref import WeakValueDictionary
 
 from cachetools import TTLCache
 from telegram import Chat, ChatMember, ChatMemberAdministrator, Update, ChatMemberOwner
 from telegram.constants import ChatMemberStatus, ParseMode, ChatType
-from telegram.ext import ContextTypes
-from telegram.error import Forbidden
+from telegram.ext import ChatMemberHandler, ContextTypes
+from telegram.error import BadRequest, Forbidden
 from zerotwobot import (DEL_CMDS, DEV_USERS, DRAGONS, SUPPORT_CHAT,
                         application)
 
-# stores admemes in memory for 10 min.
-ADMIN_CACHE = TTLCache(maxsize=512, ttl=60 * 10, timer=perf_counter)
-THREAD_LOCK = RLock()
+ADMIN_CACHE_GROUP = 14
+
+# stores admemes in memory for an hour, chat_member updates keep it fresh meanwhile.
+# those only reach admin bots, lists fetched while the bot wasn't admin expire after 10 min.
+ADMIN_CACHE = TTLCache(maxsize=512, ttl=60 * 60, timer=perf_counter)
+UNTRUSTED_ADMIN_TTL = 60 * 10
+# stores bot's own member object per chat for 5 min, dropped when its status changes.
+BOT_MEMBER_CACHE = TTLCache(maxsize=2048, ttl=60 * 5, timer=perf_counter)
+# remembers per chat the user ids already found not to be admin, for 2 min.
+NONADMIN_CACHE = TTLCache(maxsize=1024, ttl=60 * 2, timer=perf_counter)
+# stores connected chats for 15 min so connection_status doesn't call getChat on every command.
+CHAT_CACHE = TTLCache(maxsize=1024, ttl=60 * 15, timer=perf_counter)
+
+# per-chat locks and pending getChatAdministrators calls, so a burst of
+# messages after cache expiry only hits the bot api once. locks are only
+# kept alive while someone holds them, so idle chats don't pile up.
+_admin_fetch_locks: "WeakValueDictionary[int, asyncio.Lock]" = WeakValueDictionary()
+_admin_inflight: dict[int, asyncio.Future] = {}
+
+_ADMIN_STATUSES = (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER)
+
+# Telegram service account and Group Anonymous Bot are always treated as admins.
+_TG_SYSTEM_IDS = frozenset((777000, 1087968824))
+_SUDO_IDS = frozenset()
+_DEV_IDS = frozenset()
+
+
+@dataclass(frozen=True)
+class AdminSnap:
+    """Admin member objects of a chat keyed by user id, plus the owner's id if there is one.
+
+    trusted tells if the bot was admin itself when the list was fetched, only then do
+    chat_member updates keep it up to date.
+    """
+    __slots__ = ("members", "owner", "trusted", "fetched_at")
+    members: dict
+    owner: Optional[int]
+    trusted: bool
+    fetched_at: float
+
+    @classmethod
+    def from_admins(cls, chat_admins, bot_id: int) -> "AdminSnap":
+        owner = next((x.user.id for x in chat_admins if isinstance(x, ChatMemberOwner)), None)
+        members = {x.user.id: x for x in chat_admins}
+        return cls(members, owner, bot_id in members, perf_counter())
+
+    @property
+    def fresh(self) -> bool:
+        return self.trusted or perf_counter() - self.fetched_at < UNTRUSTED_ADMIN_TTL
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.members
+
+    def get(self, user_id: int) -> Optional[ChatMember]:
+        return self.members.get(user_id)
+
+    def added(self, member: ChatMember) -> "AdminSnap":
+        user_id = member.user.id
+        owner = user_id if isinstance(member, ChatMemberOwner) else (None if self.owner == user_id else self.owner)
+        return AdminSnap({**self.members, user_id: member}, owner, self.trusted, self.fetched_at)
+
+    def removed(self, user_id: int) -> "AdminSnap":
+        owner = None if self.owner == user_id else self.owner
+        members = {k: v for k, v in self.members.items() if k != user_id}
+        return AdminSnap(members, owner, self.trusted, self.fetched_at)
+
+
+def refresh_sudo_ids() -> None:
+    """Rebuild the cached sudo/dev id sets, call it after mutating DRAGONS or DEV_USERS."""
+    global _SUDO_IDS, _DEV_IDS
+    _DEV_IDS = frozenset(DEV_USERS)
+    _SUDO_IDS = frozenset(DRAGONS) | _DEV_IDS
+
+
+refresh_sudo_ids()
+
+
+class _FetchAborted(Exception):
+    """Raised to waiters when the task doing a shared admin fetch got cancelled."""
+
+
+async def _fetch_admins(chat_id: int) -> AdminSnap:
+    """Query the admins of a chat and cache them, sharing one in-flight request between callers."""
+    lock = _admin_fetch_locks.get(chat_id)
+    if lock is None:
+        lock = _admin_fetch_locks[chat_id] = asyncio.Lock()
+
+    while True:
+        async with lock:
+            inflight = _admin_inflight.get(chat_id)
+            leader = inflight is None
+            if leader:
+                inflight = _admin_inflight[chat_id] = asyncio.get_running_loop().create_future()
+
+        if leader:
+            break
+        try:
+            # shield it, cancelling one waiter must not cancel the shared fetch.
+            return await asyncio.shield(inflight)
+        except _FetchAborted:
+            # the leader was cancelled, try again (possibly as the new leader).
+            continue
+
+    try:
+        chat_admins = await application.bot.getChatAdministrators(chat_id)
+    except asyncio.CancelledError:
+        if not inflight.done():
+            inflight.set_exception(_FetchAborted())
+            inflight.exception()
+        raise
+    except Exception as excp:
+        if not inflight.done():
+            inflight.set_exception(excp)
+            # mark as retrieved, waiters (if any) still get it raised.
+            inflight.exception()
+        raise
+    else:
+        admins = AdminSnap.from_admins(chat_admins, application.bot.id)
+        ADMIN_CACHE[chat_id] = admins
+        NONADMIN_CACHE.pop(chat_id, None)
+        if not inflight.done():
+            inflight.set_result(admins)
+        return admins
+    finally:
+        if _admin_inflight.get(chat_id) is inflight:
+            del _admin_inflight[chat_id]
+
+
+def _cached_admins(chat_id: int) -> Optional[AdminSnap]:
+    """Return the cached admins of a chat, None if there are none or they are too old to use."""
+    admins = ADMIN_CACHE.get(chat_id)
+    if admins is None or not admins.fresh:
+        return None
+    return admins
+
+
+async def _get_bot_member(chat: Chat) -> ChatMember:
+    bot_member = BOT_MEMBER_CACHE.get(chat.id)
+    if bot_member is None:
+        bot_member = BOT_MEMBER_CACHE[chat.id] = await chat.get_member(application.bot.id)
+    return bot_member
+
+
+async def _get_admin_member(chat: Chat, user_id: int) -> Optional[ChatMember]:
+    """Return user's admin member object, None if they aren't an admin.
+
+    Only admin lists fetched while the bot was admin are trusted, chat_member updates keep those
+    up to date. Where the bot isn't admin the user is looked up live instead.
+    """
+    admins = ADMIN_CACHE.get(chat.id)
+    if admins is None or not admins.trusted:
+        if not await is_bot_admin(chat, application.bot.id):
+            member = await chat.get_member(user_id)
+            return member if member.status in _ADMIN_STATUSES else None
+        # only filled from trusted lists, and dropped with them when the bot's status changes.
+        if admins is None and user_id in NONADMIN_CACHE.get(chat.id, ()):
+            return None
+        admins = await _fetch_admins(chat.id)
+
+    member = admins.get(user_id)
+    if member is None and admins.trusted:
+        NONADMIN_CACHE.setdefault(chat.id, set()).add(user_id)
+    return member
+
+
+async def update_admin_cache(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    member_update = update.chat_member or update.my_chat_member
+    chat_id = member_update.chat.id
+    new_member = member_update.new_chat_member
+    user_id = new_member.user.id
+    if user_id == context.bot.id:
+        # whatever was cached may have been taken while chat_member updates weren't reaching us.
+        BOT_MEMBER_CACHE.pop(chat_id, None)
+        CHAT_CACHE.pop(chat_id, None)
+        ADMIN_CACHE.pop(chat_id, None)
+        NONADMIN_CACHE.pop(chat_id, None)
+        return
+
+    if new_member.status in _ADMIN_STATUSES:
+        NONADMIN_CACHE.get(chat_id, set()).discard(user_id)
+
+    admins = ADMIN_CACHE.get(chat_id)
+    # nothing cached for this chat yet, next lookup will fetch a fresh list anyway.
+    if admins is None:
+        return
+
+    if new_member.status in _ADMIN_STATUSES:
+        # also replaces the stored member when only an admin's rights changed.
+        ADMIN_CACHE[chat_id] = admins.added(new_member)
+    elif user_id in admins:
+        ADMIN_CACHE[chat_id] = admins.removed(user_id)
+
 
 def check_admin(
         permission: str = None,
@@ -38,150 +231,218 @@ def check_admin(
         no_reply (boot, optional): if should not reply. Defaults to False.
     """
     def wrapper(func):
-        @wraps(func)
-        async def wrapped(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
-            nonlocal permission
+        if permission:
+            perm_get = attrgetter(permission)
+
+            def bot_allowed(bot_member: ChatMember) -> bool:
+                return isinstance(bot_member, ChatMemberAdministrator) and perm_get(bot_member)
+
+            def user_allowed(user_member: ChatMember, user_id: int) -> bool:
+                return (
+                    isinstance(user_member, ChatMemberOwner)
+                    or (isinstance(user_member, ChatMemberAdministrator) and perm_get(user_member))
+                    or user_id in _SUDO_IDS
+                )
+        else:
+            def bot_allowed(bot_member: ChatMember) -> bool:
+                return bot_member.status == ChatMemberStatus.ADMINISTRATOR
+
+            def user_allowed(user_member: ChatMember, user_id: int) -> bool:
+                return (user_member is not None and user_member.status in _ADMIN_STATUSES) or user_id in _SUDO_IDS
+
+        if permission:
+            no_permission = permission.replace("_", " ").replace("can", "")
+            bot_denied_text = f"I don't have permission to {no_permission}."
+            user_denied_text = f"You don't have permission to {no_permission}."
+        else:
+            bot_denied_text = "I'm not admin here."
+            user_denied_text = "You are not admin here."
+
+        async def bot_denied(message):
+            if no_reply:
+                return
+            return await message.reply_text(bot_denied_text)
+
+        async def user_denied(message):
+            if no_reply:
+                return
+            return await message.reply_text(user_denied_text)
+
+        async def wrapped_only_owner(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+            user = update.effective_user
+            if user is None:
+                return
+            if user.id in _DEV_IDS:
+                return await func(update, context, *args, **kwargs)
+
             chat = update.effective_chat
+            admins = _cached_admins(chat.id)
+            if admins is not None:
+                is_owner = user.id == admins.owner
+            else:
+                is_owner = isinstance(await chat.get_member(user.id), ChatMemberOwner)
+            if is_owner:
+                return await func(update, context, *args, **kwargs)
+            return await update.effective_message.reply_text("Only chat owner can perform this action.")
+
+        async def wrapped_only_dev(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+            user = update.effective_user
+            if user is None:
+                return
+            if user.id in _DEV_IDS:
+                return await func(update, context, *args, **kwargs)
+            return await update.effective_message.reply_text(
+                "Hey little kid"
+                "\nWho the hell are you to say me what to execute on my server?",
+            )
+
+        async def wrapped_only_sudo(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
             user = update.effective_user
+            if user is None:
+                return
+            if user.id in _SUDO_IDS:
+                return await func(update, context, *args, **kwargs)
+            return await update.effective_message.reply_text("Who the hell are you to say me what to do?",)
+
+        async def wrapped_is_bot(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+            user = update.effective_user
+            if user is None:
+                return
+            chat = update.effective_chat
             message = update.effective_message
+            if chat.type == ChatType.PRIVATE or user.id == 1087968824:
+                return await func(update, context, *args, **kwargs)
 
+            bot_member = BOT_MEMBER_CACHE.get(chat.id)
+            if bot_member is None:
+                bot_member = await _get_bot_member(chat)
+            if bot_allowed(bot_member):
+                return await func(update, context, *args, **kwargs)
+            return await bot_denied(message)
 
+        async def wrapped_is_user(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+            user = update.effective_user
+            if user is None:
+                return
+            chat = update.effective_chat
+            message = update.effective_message
+            if chat.type == ChatType.PRIVATE or user.id == 1087968824:
+                return await func(update, context, *args, **kwargs)
 
-            if chat.type == ChatType.PRIVATE and not (only_dev or only_sudo or only_owner):
+            # sudo users pass regardless of their rights, no need to ask the api.
+            if user.id in _SUDO_IDS or user_allowed(await _get_admin_member(chat, user.id), user.id):
                 return await func(update, context, *args, **kwargs)
+            return await user_denied(message)
 
-            bot_member = await chat.get_member(context.bot.id) if is_bot or is_both else None
-            user_member = await chat.get_member(user.id) if is_user or is_both else None
-
-            if only_owner:
-                if isinstance(user_member, ChatMemberOwner) or user.id in DEV_USERS:
-                    return await func(update, context, *args, **kwargs)
-                else:
-                    return await message.reply_text("Only chat owner can perform this action.")
-            if only_dev:
-                if user.id in DEV_USERS:
-                    return await func(update, context, *args, **kwargs)
-                else:
-                    return await update.effective_message.reply_text(
-                        "Hey little kid"
-                        "\nWho the hell are you to say me what to execute on my server?",
-                    )
-                    
-            if only_sudo:
-                if user.id in DRAGONS:
-                    return await func(update, context, *args, **kwargs)
-                else:
-                    return await update.effective_message.reply_text("Who the hell are you to say me what to do?",)
-            
-            if message.from_user.id == 1087968824:
+        async def wrapped_is_both(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+            user = update.effective_user
+            if user is None:
+                return
+            chat = update.effective_chat
+            message = update.effective_message
+            if chat.type == ChatType.PRIVATE or user.id == 1087968824:
                 return await func(update, context, *args, **kwargs)
-              
-            if permission:
-                no_permission = permission.replace("_", " ").replace("can", "")
-                if is_bot:
-                    if (getattr(bot_member, permission) if isinstance(bot_member, ChatMemberAdministrator) else False):
-                        return await func(update, context, *args, **kwargs)
-                    elif no_reply:
-                        return
-                    else:
-                        return await message.reply_text(f"I don't have permission to {no_permission}.")
-                if is_user:
-                    if isinstance(user_member, ChatMemberOwner):
-                        return await func(update, context, *args, **kwargs)
-                    elif (
-                        getattr(user_member, permission) if isinstance(user_member, ChatMemberAdministrator) else False
-                        or user.id in DRAGONS
-                        ):
-                        return await func(update, context, *args, **kwargs)
-                    elif no_reply:
-                        return
-                    else:
-                        return await message.reply_text(f"You don't have permission to {no_permission}.")
-                if is_both:
-                    if (getattr(bot_member, permission) if isinstance(bot_member, ChatMemberAdministrator) else False):
-                        pass
-                    elif no_reply:
-                        return
-                    else:
-                        return await message.reply_text(f"I don't have permission to {no_permission}.")
-
-                    if isinstance(user_member, ChatMemberOwner) or user.id in DEV_USERS:
-                        pass
-                    elif (
-                        getattr(user_member, permission) if isinstance(user_member, ChatMemberAdministrator) else False
-                        or user.id in DRAGONS
-                        ):
-                        pass
-                    elif no_reply:
-                        return
-                    else:
-                        return await message.reply_text(f"You don't have permission to {no_permission}.")
-                    return await func(update, context, *args, **kwargs)
+
+            bot_member = BOT_MEMBER_CACHE.get(chat.id)
+            if bot_member is not None and not bot_allowed(bot_member):
+                return await bot_denied(message)
+
+            if user.id in _SUDO_IDS:
+                if bot_member is None and not bot_allowed(await _get_bot_member(chat)):
+                    return await bot_denied(message)
+                return await func(update, context, *args, **kwargs)
+
+            if bot_member is None:
+                # nothing cached, look both up live at once, a live user member needs no admin list.
+                bot_member, user_member = await asyncio.gather(_get_bot_member(chat), chat.get_member(user.id))
+                if not bot_allowed(bot_member):
+                    return await bot_denied(message)
             else:
-                if is_bot:
-                    if bot_member.status == ChatMemberStatus.ADMINISTRATOR:
-                        return await func(update, context, *args, **kwargs)
-                    else:
-                        return await message.reply_text("I'm not admin here.")
-                elif is_user:
-                    if user_member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
-                        return await func(update, context, *args, **kwargs)
-                    elif user.id in DRAGONS:
-                        return await func(update, context, *args, **kwargs)
-                    else:
-                        return await message.reply_text("You are not admin here.")
-                elif is_both:
-                    if bot_member.status == ChatMemberStatus.ADMINISTRATOR:
-                        pass
-                    else:
-                        return await message.reply_text("I'm not admin here.")
-                        
-                    if user_member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
-                        pass
-                    elif user.id in DRAGONS:
-                        pass
-                    else:
-                        return await message.reply_text("You are not admin here.")
-                    return await func(update, context, *args, **kwargs)
-        return wrapped
+                user_member = await _get_admin_member(chat, user.id)
+            if not user_allowed(user_member, user.id):
+                return await user_denied(message)
+            return await func(update, context, *args, **kwargs)
+
+        # pick the check once here instead of walking every flag on each update.
+        if only_owner:
+            wrapped = wrapped_only_owner
+        elif only_dev:
+            wrapped = wrapped_only_dev
+        elif only_sudo:
+            wrapped = wrapped_only_sudo
+        elif is_bot:
+            wrapped = wrapped_is_bot
+        elif is_user:
+            wrapped = wrapped_is_user
+        elif is_both:
+            wrapped = wrapped_is_both
+        else:
+            raise ValueError("check_admin needs one of is_bot, is_user, is_both, only_owner, only_sudo or only_dev")
+        return wraps(func)(wrapped)
     return wrapper
 
 
 def is_whitelist_plus(chat: Chat, user_id: int, member: ChatMember = None) -> bool:
-    return any(user_id in user for user in [DRAGONS, DEV_USERS])
+    return user_id in _SUDO_IDS
 
 
 def is_support_plus(chat: Chat, user_id: int, member: ChatMember = None) -> bool:
-    return user_id in DRAGONS or user_id in DEV_USERS
+    return user_id in _SUDO_IDS
 
 
-async def is_user_admin(chat: Chat, user_id: int, member: ChatMember = None) -> bool:
+def is_user_admin_fast(chat: Chat, user_id: int) -> Optional[bool]:
+    """Resolve admin status without awaiting, returns None when the bot api has to be asked."""
     if (
         chat.type == "private"
-        or user_id in DRAGONS
-        or user_id in DEV_USERS
-        or user_id in [777000, 1087968824]
+        or user_id in _SUDO_IDS
+        or user_id in _TG_SYSTEM_IDS
     ):  # Count telegram and Group Anonymous as admin
         return True
+
+    admins = _cached_admins(chat.id)
+    if admins is None:
+        if user_id in NONADMIN_CACHE.get(chat.id, ()):
+            return False
+        return None
+    return user_id in admins
+
+
+async def _is_user_admin_slow(chat: Chat, user_id: int) -> bool:
+    # cache is deleted, so query bot api again and return user status
+    # while saving it in cache for future usage...
+    try:
+        admins = await _fetch_admins(chat.id)
+    except Forbidden:
+        return False
+
+    return user_id in admins
+
+
+async def is_user_admin(chat: Chat, user_id: int, member: ChatMember = None) -> bool:
     if not member:
-        with THREAD_LOCK:
-            # try to fetch from cache first.
-            try:
-                return user_id in ADMIN_CACHE[chat.id]
-            except KeyError:
-                # keyerror happend means cache is deleted,
-                # so query bot api again and return user status
-                # while saving it in cache for future usage...
-                try:
-                    chat_admins = await application.bot.getChatAdministrators(chat.id)
-                except Forbidden:
-                    return False
-                admin_list = [x.user.id for x in chat_admins]
-                ADMIN_CACHE[chat.id] = admin_list
-
-                return user_id in admin_list
+        # try to resolve from sudo sets and cache first.
+        is_admin = is_user_admin_fast(chat, user_id)
+        if is_admin is not None:
+            return is_admin
+        return await _is_user_admin_slow(chat, user_id)
     else:
-        return member.status in (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER)
+        return (
+            chat.type == "private"
+            or user_id in _SUDO_IDS
+            or user_id in _TG_SYSTEM_IDS
+            or member.status in _ADMIN_STATUSES
+        )
+
+
+def is_bot_admin_fast(chat: Chat) -> Optional[bool]:
+    """Resolve bot's admin status without awaiting, returns None when the bot api has to be asked."""
+    if chat.type == "private":
+        return True
+
+    bot_member = BOT_MEMBER_CACHE.get(chat.id)
+    if bot_member is None:
+        return None
+    return bot_member.status in _ADMIN_STATUSES
 
 
 async def is_bot_admin(chat: Chat, bot_id: int, bot_member: ChatMember = None) -> bool:
@@ -189,48 +450,64 @@ async def is_bot_admin(chat: Chat, bot_id: int, bot_member: ChatMember = None) -
         return True
 
     if not bot_member:
-        bot_member = await chat.get_member(bot_id)
+        is_admin = is_bot_admin_fast(chat)
+        if is_admin is not None:
+            return is_admin
+        bot_member = await _get_bot_member(chat)
+
+    return bot_member.status in _ADMIN_STATUSES
+
+
+async def bot_has_permission(chat: Chat, permission: str) -> bool:
+    bot_member = await _get_bot_member(chat)
+    return isinstance(bot_member, ChatMemberAdministrator) and getattr(bot_member, permission)
 
-    return bot_member.status in (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER)
 
 async def can_delete(chat: Chat, bot_id: int) -> bool:
-    chat_member = await chat.get_member(bot_id)
-    if isinstance(chat_member, ChatMemberAdministrator):
-        return chat_member.can_delete_messages
+    return await bot_has_permission(chat, "can_delete_messages")
 
 
 async def is_user_ban_protected(chat: Chat, user_id: int, member: ChatMember = None) -> bool:
     if (
         chat.type == "private"
-        or user_id in DRAGONS
-        or user_id in DEV_USERS
-        or user_id in [777000, 1087968824]
+        or user_id in _SUDO_IDS
+        or user_id in _TG_SYSTEM_IDS
     ):  # Count telegram and Group Anonymous as admin
         return True
 
     if not member:
         member = await chat.get_member(user_id)
 
-    return member.status in (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER)
+    return member.status in _ADMIN_STATUSES
 
 async def is_user_in_chat(chat: Chat, user_id: int) -> bool:
     member = await chat.get_member(user_id)
     return member.status in (ChatMemberStatus.LEFT, ChatMemberStatus.RESTRICTED)
 
+
+async def _maybe_delete_cmd(message) -> None:
+    """Delete a bare command sent by someone not allowed to use it, if DEL_CMDS is on."""
+    if not DEL_CMDS:
+        return
+    # media messages have no text, only commands with no arguments get deleted.
+    if " " in (message.text or ""):
+        return
+    try:
+        await message.delete()
+    except (BadRequest, Forbidden):
+        pass
+
+
 def support_plus(func):
     @wraps(func)
     async def is_support_plus_func(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
-        bot = context.bot
         user = update.effective_user
         chat = update.effective_chat
+        message = update.effective_message
 
-        if user and is_support_plus(chat, user.id):
-            return await func(update, context, *args, **kwargs)
-        elif DEL_CMDS and " " not in update.effective_message.text:
-            try:
-                await update.effective_message.delete()
-            except:
-                pass
+        if user is None or not is_support_plus(chat, user.id):
+            return await _maybe_delete_cmd(message)
+        return await func(update, context, *args, **kwargs)
 
     return is_support_plus_func
 
@@ -240,7 +517,6 @@ def whitelist_plus(func):
     async def is_whitelist_plus_func(
         update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs,
     ):
-        bot = context.bot
         user = update.effective_user
         chat = update.effective_chat
 
@@ -256,20 +532,24 @@ def whitelist_plus(func):
 def user_not_admin(func):
     @wraps(func)
     async def is_not_admin(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
-        bot = context.bot
         user = update.effective_user
         chat = update.effective_chat
 
-        if user and not await is_user_admin(chat, user.id):
+        if user is None:
+            return
+
+        is_admin = is_user_admin_fast(chat, user.id)
+        if is_admin is None:
+            is_admin = await _is_user_admin_slow(chat, user.id)
+        if not is_admin:
             return await func(update, context, *args, **kwargs)
-        elif not user:
-            pass
 
     return is_not_admin
 
 def connection_status(func):
     @wraps(func)
     async def connected_status(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+        message = update.effective_message
         conn = await connected(
             context.bot,
             update,
@@ -279,12 +559,14 @@ def connection_status(func):
         )
 
         if conn:
-            chat = await application.bot.getChat(conn)
+            chat = CHAT_CACHE.get(conn)
+            if chat is None:
+                chat = CHAT_CACHE[conn] = await application.bot.getChat(conn)
             update.__setattr__("_effective_chat", chat)
             return await func(update, context, *args, **kwargs)
         else:
-            if update.effective_message.chat.type == "private":
-                await update.effective_message.reply_text(
+            if message.chat.type == "private":
+                await message.reply_text(
                     "Send /connect in a group that you and I have in common first.",
                 )
                 return connected_status
@@ -294,6 +576,11 @@ def connection_status(func):
     return connected_status
 
 
+ADMIN_CACHE_HANDLER = ChatMemberHandler(update_admin_cache, ChatMemberHandler.ANY_CHAT_MEMBER, block=False)
+
+application.add_handler(ADMIN_CACHE_HANDLER, group=ADMIN_CACHE_GROUP)
+
+
 # Workaround for circular import with connection.py
 from zerotwobot.modules import connection
 